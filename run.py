@@ -7,12 +7,19 @@ import time
 import random
 import threading
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+import rlp
+from eth_keys import keys
+from eth_utils import keccak, to_canonical_address
 from web3 import Web3
 from eth_account import Account
 from prometheus_client import Counter, Gauge, Histogram, start_http_server
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
 
 # Setup logging
 logging.basicConfig(
@@ -33,7 +40,7 @@ gas_price_gwei = Gauge('eth_gas_price_gwei', 'Current gas price in Gwei')
 block_number = Gauge('eth_block_number', 'Current block number')
 connection_status = Gauge('eth_connection_status', 'Connection status (1=connected, 0=disconnected)')
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoadTestConfig:
     rpc_url: str
     num_accounts: int
@@ -51,20 +58,53 @@ class LoadTestConfig:
 class EthereumLoadTester:
     def __init__(self, config: LoadTestConfig):
         self.config = config
+        # Keep-alive session shared by web3 and raw JSON-RPC batch requests,
+        # pool sized so concurrent requests don't open fresh sockets
+        pool_size = max(32, config.txs_per_batch)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=3)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         # Add timeout to HTTP provider
         self.w3 = Web3(Web3.HTTPProvider(
             config.rpc_url,
-            request_kwargs={'timeout': 10}  # 10 second timeout
+            request_kwargs={'timeout': 10},  # 10 second timeout
+            session=self.session
         ))
         self.accounts: List[Account] = []
         self.running = False
-        self.pending_txs = set()
+        # Count of sent txs still waiting for a receipt, read by the gauge at
+        # scrape time so senders never write the gauge themselves
+        self.pending = 0
+        self.pending_lock = threading.Lock()
+        tx_pending.set_function(lambda: self.pending)
+        # Sent txs handed over to the receipt reaper as (tx_hash_hex, start_time)
+        self.receipt_queue = deque()
+        # Authoritative next nonce per account, only touched under its lock
+        self.nonces: Dict[str, int] = {}
+        self.nonce_locks: Dict[str, threading.Lock] = {}
+        # Pre-encoded RLP chunks of the tx fields shared by the whole batch,
+        # see _build_tx_template
+        self.tx_template = None
+        # Signing keys and RLP encoded addresses resolved once per account
+        self.signing_keys: Dict[str, keys.PrivateKey] = {}
+        self.encoded_addresses: Dict[str, bytes] = {}
+        # Funding amounts converted to wei once instead of per send
+        self.fund_amount_wei = Web3.to_wei(config.fund_amount_ether, 'ether')
+        self.specific_account_fund_amount_wei = Web3.to_wei(config.specific_account_fund_amount, 'ether')
+        # Balance gauge children resolved once per account
+        self.balance_gauges: Dict[str, Gauge] = {}
+        # One sender worker per account, each drains its own account's queue
+        self.executor = ThreadPoolExecutor(max_workers=config.num_accounts, thread_name_prefix='sender')
+        # Chain ID never changes for the lifetime of the node, it is cached
+        # once by the connection check and reused for every transaction
+        self.chain_id = None
 
         # Wait for connection with retries
         self._wait_for_connection()
 
         logger.info(f"Connected to Ethereum node at {config.rpc_url}")
-        logger.info(f"Chain ID: {self.w3.eth.chain_id}")
+        logger.info(f"Chain ID: {self.chain_id}")
 
     def _wait_for_connection(self, max_retries=30, retry_delay=2):
         """Wait for Ethereum node to be ready"""
@@ -74,7 +114,7 @@ class EthereumLoadTester:
             try:
                 if self.w3.is_connected():
                     # Additional check: try to get chain_id
-                    chain_id = self.w3.eth.chain_id
+                    self.chain_id = self.w3.eth.chain_id
                     logger.info(f"Connection successful on attempt {attempt + 1}")
                     return
             except Exception as e:
@@ -86,16 +126,53 @@ class EthereumLoadTester:
 
         raise Exception(f"Cannot connect to {self.config.rpc_url} after {max_retries} attempts")
 
-    def _check_connection(self):
-        """Check if connection is alive with timeout"""
+    def _batch_rpc(self, calls):
+        """Send several JSON-RPC calls in a single HTTP round-trip"""
+        payload = [
+            {'jsonrpc': '2.0', 'method': method, 'params': params, 'id': i}
+            for i, (method, params) in enumerate(calls)
+        ]
+        response = self.session.post(self.config.rpc_url, json=payload, timeout=10)
+        response.raise_for_status()
+
+        # Responses may come back in any order, map them by id
+        results = [None] * len(calls)
+        for item in response.json():
+            if 'error' in item:
+                raise ValueError(f"{calls[item['id']][0]} failed: {item['error']}")
+            results[item['id']] = item['result']
+        return results
+
+    def _batch_rpc_chunked(self, calls, max_batch=1000):
+        """Run _batch_rpc in chunks that stay under geth's default batch item limit"""
+        results = []
+        for i in range(0, len(calls), max_batch):
+            results.extend(self._batch_rpc(calls[i:i + max_batch]))
+        return results
+
+    def sync_nonces(self):
+        """Seed local nonces of all accounts from the node in batches"""
         try:
-            # Quick connection check with timeout
-            self.w3.eth.block_number
-            connection_status.set(1)  # Connected
+            results = self._batch_rpc_chunked([
+                ('eth_getTransactionCount', [account.address, 'pending'])
+                for account in self.accounts
+            ])
+        except Exception as e:
+            logger.error(f"Error syncing nonces: {e}")
+            return
+
+        for account, nonce in zip(self.accounts, results):
+            with self.nonce_locks[account.address]:
+                self.nonces[account.address] = int(nonce, 16)
+
+    def _resync_nonce(self, address: str):
+        """Reload a single account's nonce from the node, returns whether it succeeded"""
+        try:
+            with self.nonce_locks[address]:
+                self.nonces[address] = self.w3.eth.get_transaction_count(address, 'pending')
             return True
         except Exception as e:
-            logger.warning(f"Connection check failed: {e}")
-            connection_status.set(0)  # Disconnected
+            logger.error(f"Error resyncing nonce for {address}: {e}")
             return False
 
     def fund_specific_account(self):
@@ -114,8 +191,9 @@ class EthereumLoadTester:
             tx_hash = self.w3.eth.send_transaction({
                 'from': dev_account,
                 'to': self.config.specific_account_address,
-                'value': self.w3.to_wei(self.config.specific_account_fund_amount, 'ether'),
+                'value': self.specific_account_fund_amount_wei,
                 'gas': 21000,
+                'chainId': self.chain_id,
             })
 
             # Wait for transaction
@@ -138,9 +216,15 @@ class EthereumLoadTester:
         for i in range(self.config.num_accounts):
             account = Account.create()
             self.accounts.append(account)
-            logger.info(f"Created account {i+1}/{self.config.num_accounts}: {account.address}")
+            self.nonces[account.address] = 0
+            self.nonce_locks[account.address] = threading.Lock()
+            self.balance_gauges[account.address] = current_balance.labels(address=account.address)
+            self.signing_keys[account.address] = keys.PrivateKey(account.key)
+            self.encoded_addresses[account.address] = rlp.encode(to_canonical_address(account.address))
+            logger.debug("Created account %d/%d: %s", i + 1, self.config.num_accounts, account.address)
 
         accounts_created.set(len(self.accounts))
+        logger.info(f"Created {len(self.accounts)} accounts")
 
     def fund_accounts(self):
         """Fund accounts from the dev account"""
@@ -149,76 +233,132 @@ class EthereumLoadTester:
         # Get dev account (unlocked in dev mode)
         dev_account = self.w3.eth.accounts[0]
 
+        try:
+            dev_nonce, gas_price = (int(result, 16) for result in self._batch_rpc([
+                ('eth_getTransactionCount', [dev_account, 'pending']),
+                ('eth_gasPrice', []),
+            ]))
+        except Exception as e:
+            logger.error(f"Error funding accounts: {e}")
+            return
+
+        # Send every funding tx before waiting on any receipt, incrementing the
+        # dev account nonce locally so they can all be mined in the same block
+        receipts = {}
         for i, account in enumerate(self.accounts):
             try:
-                # Send funds to account
                 tx_hash = self.w3.eth.send_transaction({
                     'from': dev_account,
                     'to': account.address,
-                    'value': self.w3.to_wei(self.config.fund_amount_ether, 'ether'),
+                    'value': self.fund_amount_wei,
                     'gas': 21000,
+                    'gasPrice': gas_price,
+                    'chainId': self.chain_id,
+                    'nonce': dev_nonce,
                 })
+                dev_nonce += 1
+                receipts[i] = self.executor.submit(self.w3.eth.wait_for_transaction_receipt, tx_hash)
+
+            except Exception as e:
+                logger.error(f"Error funding account {account.address}: {e}")
 
-                # Wait for transaction
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+                # The rejected tx may not have used its nonce, resync it so the
+                # remaining funding txs don't queue behind a gap
+                try:
+                    dev_nonce = self.w3.eth.get_transaction_count(dev_account, 'pending')
+                except Exception as e:
+                    logger.error(f"Error funding accounts: {e}")
+                    break
 
-                if receipt['status'] == 1:
-                    balance = self.w3.eth.get_balance(account.address)
-                    logger.info(f"Funded account {i+1}: {account.address} with {self.w3.from_wei(balance, 'ether')} ETH")
-                    current_balance.labels(address=account.address).set(balance)
+        funded = []
+        for i, future in receipts.items():
+            account = self.accounts[i]
+            try:
+                if future.result()['status'] == 1:
+                    funded.append(i)
                 else:
                     logger.error(f"Failed to fund account {account.address}")
 
             except Exception as e:
                 logger.error(f"Error funding account {account.address}: {e}")
 
+        if not funded:
+            return
+
+        try:
+            balances = self._batch_rpc_chunked([('eth_getBalance', [self.accounts[i].address, 'latest']) for i in funded])
+        except Exception as e:
+            logger.error(f"Error fetching funded balances: {e}")
+            return
+
+        for i, balance in zip(funded, balances):
+            account = self.accounts[i]
+            balance = int(balance, 16)
+            logger.info(f"Funded account {i+1}: {account.address} with {self.w3.from_wei(balance, 'ether')} ETH")
+            self.balance_gauges[account.address].set(balance)
+
+    def _build_tx_template(self, gas_price: int):
+        """Pre-encode the tx fields that are the same for every tx in a batch"""
+        self.tx_template = (
+            # gasPrice, gas
+            rlp.encode(gas_price) + rlp.encode(self.config.gas_limit),
+            # value, data
+            rlp.encode(self.config.tx_value_wei) + rlp.encode(b''),
+            # EIP-155 signing suffix: chainId, 0, 0
+            rlp.encode(self.chain_id) + rlp.encode(0) + rlp.encode(0),
+        )
+
+    @staticmethod
+    def _rlp_list(payload: bytes) -> bytes:
+        """Wrap already RLP-encoded items in an RLP list header"""
+        if len(payload) < 56:
+            return bytes([0xc0 + len(payload)]) + payload
+        length = len(payload).to_bytes((len(payload).bit_length() + 7) // 8, 'big')
+        return bytes([0xf7 + len(length)]) + length + payload
+
+    def _sign_transaction(self, from_address: str, nonce: int, to_address: str) -> bytes:
+        """Sign a legacy EIP-155 transfer, encoding only nonce and recipient
+
+        Equivalent to LocalAccount.sign_transaction for this fixed tx shape,
+        without its per-call field validation and conversion.
+        """
+        fee_fields, value_fields, signing_suffix = self.tx_template
+        fields = rlp.encode(nonce) + fee_fields + self.encoded_addresses[to_address] + value_fields
+
+        unsigned = fields + signing_suffix
+        signature = self.signing_keys[from_address].sign_msg_hash(keccak(self._rlp_list(unsigned)))
+
+        v = signature.v + 35 + 2 * self.chain_id
+        signed = b''.join((fields, rlp.encode(v), rlp.encode(signature.r), rlp.encode(signature.s)))
+        return self._rlp_list(signed)
+
     def send_transaction(self, from_account: Account, to_address: str):
         """Send a single transaction"""
+        nonce = None
         try:
-            # Check if connection is still alive (with timeout)
-            if not self._check_connection():
-                logger.warning("Web3 connection lost")
-                raise ConnectionError("Not connected to Ethereum node")
-
-            # Get nonce with timeout protection (including pending)
-            nonce = self.w3.eth.get_transaction_count(from_account.address, 'pending')
-
-            # Build transaction
-            gas_price = self.w3.eth.gas_price
-
-            tx = {
-                'nonce': nonce,
-                'to': to_address,
-                'value': self.config.tx_value_wei,
-                'gas': self.config.gas_limit,
-                'gasPrice': gas_price,
-                'chainId': self.w3.eth.chain_id,
-            }
+            # Reserve the next nonce, the account's lock is only held for the
+            # increment so signing and sending run outside of it
+            with self.nonce_locks[from_account.address]:
+                nonce = self.nonces[from_account.address]
+                self.nonces[from_account.address] += 1
 
             # Sign transaction
-            signed_tx = from_account.sign_transaction(tx)
+            raw_tx = self._sign_transaction(from_account.address, nonce, to_address)
 
-            # Send transaction - handle both old and new attribute names
+            # Send transaction
             start_time = time.time()
-            raw_tx = getattr(signed_tx, 'rawTransaction', None) or getattr(signed_tx, 'raw_transaction', None)
-
-            if raw_tx is None:
-                raise AttributeError("Could not find raw transaction data in signed transaction")
-
             tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
 
-            tx_sent_total.inc()
-            self.pending_txs.add(tx_hash.hex())
-            tx_pending.set(len(self.pending_txs))
+            # Hex encoded once, reused for logging and receipt polling
+            tx_hash_hex = tx_hash.hex()
 
-            logger.debug(f"Sent tx: {tx_hash.hex()}")
+            with self.pending_lock:
+                self.pending += 1
 
-            # Wait for receipt in background
-            threading.Thread(
-                target=self._wait_for_receipt,
-                args=(tx_hash, start_time),
-                daemon=True
-            ).start()
+            logger.debug("Sent tx: %s", tx_hash_hex)
+
+            # Receipt is picked up by the reaper thread
+            self.receipt_queue.append((tx_hash_hex, start_time))
 
             return tx_hash
 
@@ -226,73 +366,193 @@ class EthereumLoadTester:
             error_msg = str(e)
 
             # Handle specific error cases
-            if 'replacement transaction underpriced' in error_msg:
-                logger.warning(f"Nonce collision for {from_account.address}, skipping")
+            if 'replacement transaction underpriced' in error_msg or 'nonce too low' in error_msg:
+                logger.warning(f"Nonce collision for {from_account.address}, resyncing nonce")
             else:
                 logger.error(f"Error sending transaction from {from_account.address}: {e}")
 
-            tx_sent_total.inc()  # Count as sent attempt
-            tx_failed_total.inc()  # Also count as failed
+            # The reserved nonce was not used and would leave a gap, reload
+            # the account's nonce from the node, or hand the reserved nonce
+            # back if the node can't be reached (each account has a single
+            # sender worker per batch, so nothing reserved after it)
+            if nonce is not None and not self._resync_nonce(from_account.address):
+                with self.nonce_locks[from_account.address]:
+                    self.nonces[from_account.address] = nonce
+
+            # Only transport failures mean the node is unreachable, the
+            # periodic check in update_metrics flips it back once it recovers
+            if isinstance(e, (requests.ConnectionError, requests.HTTPError, requests.Timeout)):
+                connection_status.set(0)  # Disconnected
+
             return None
 
-    def _wait_for_receipt(self, tx_hash, start_time):
-        """Wait for transaction receipt"""
-        try:
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-            duration = time.time() - start_time
+    def _receipt_reaper(self, poll_interval=0.5, stale_after=30, timeout=120):
+        """Match pending transactions against receipts of newly mined blocks"""
+        in_flight = {}
+        # When each in-flight tx was last looked up directly, so a stuck tx is
+        # only looked up once per stale_after window
+        last_checked = {}
+        last_block = None
 
-            if receipt['status'] == 1:
-                tx_success_total.inc()
-                tx_duration.observe(duration)
-                logger.debug(f"Tx confirmed: {tx_hash.hex()} in {duration:.2f}s")
-            else:
-                tx_failed_total.inc()
-                logger.error(f"Tx failed: {tx_hash.hex()}")
+        while self.running:
+            time.sleep(poll_interval)
+
+            receipts = []
+            try:
+                # Receipts are fetched by block number for every block mined
+                # since the last processed one, which only advances once its
+                # receipts were fetched so a failed fetch is retried next scan
+                head = self.w3.eth.block_number
+                if last_block is not None and head > last_block and (in_flight or self.receipt_queue):
+                    for block_receipts in self._batch_rpc_chunked([
+                        ('eth_getBlockReceipts', [hex(number)]) for number in range(last_block + 1, head + 1)
+                    ]):
+                        receipts.extend(block_receipts or [])
+                last_block = head
+            except Exception as e:
+                logger.error(f"Error fetching block receipts: {e}")
+
+            # Pick up everything sent since the last scan, after the block
+            # fetch so a tx already mined in a fetched block is still matched
+            while self.receipt_queue:
+                tx_hash_hex, start_time = self.receipt_queue.popleft()
+                in_flight[tx_hash_hex] = start_time
+                last_checked[tx_hash_hex] = start_time
+
+            # Txs not matched for a while (e.g. mined in a block that was
+            # fetched before they were queued) fall back to a direct lookup
+            now = time.time()
+            stale = [tx_hash_hex for tx_hash_hex in in_flight if now - last_checked[tx_hash_hex] >= stale_after]
+            stale_receipts = []
+            if stale:
+                for tx_hash_hex in stale:
+                    last_checked[tx_hash_hex] = now
+                try:
+                    stale_receipts = [
+                        receipt for receipt in self._batch_rpc_chunked([
+                            ('eth_getTransactionReceipt', [tx_hash_hex]) for tx_hash_hex in stale
+                        ])
+                        if receipt is not None
+                    ]
+                except Exception as e:
+                    logger.error(f"Error looking up stale receipts: {e}")
+
+            now = time.time()
+            success = 0
+            failed = 0
+
+            # Stale lookups can't tell when the tx was mined, so their
+            # duration is not observed
+            for batch_receipts, timed in ((receipts, True), (stale_receipts, False)):
+                for receipt in batch_receipts:
+                    start_time = in_flight.pop(receipt['transactionHash'], None)
+                    if start_time is None:
+                        # Not sent by us, or already counted
+                        continue
+                    del last_checked[receipt['transactionHash']]
+
+                    if int(receipt['status'], 16) == 1:
+                        success += 1
+                        if timed:
+                            duration = now - start_time
+                            tx_duration.observe(duration)
+                            logger.debug("Tx confirmed: %s in %.2fs", receipt['transactionHash'], duration)
+                    else:
+                        failed += 1
+                        logger.error(f"Tx failed: {receipt['transactionHash']}")
+
+            # Give up on txs that never got mined
+            for tx_hash_hex in [tx_hash_hex for tx_hash_hex, start_time in in_flight.items() if now - start_time >= timeout]:
+                del in_flight[tx_hash_hex]
+                del last_checked[tx_hash_hex]
+                failed += 1
+                logger.error(f"Error waiting for receipt {tx_hash_hex}: timed out after {timeout}s")
 
-            # Remove from pending
-            if tx_hash.hex() in self.pending_txs:
-                self.pending_txs.remove(tx_hash.hex())
-                tx_pending.set(len(self.pending_txs))
+            # Flush metrics once per scan
+            tx_success_total.inc(success)
+            tx_failed_total.inc(failed)
+            with self.pending_lock:
+                self.pending -= success + failed
 
-        except Exception as e:
-            logger.error(f"Error waiting for receipt {tx_hash.hex()}: {e}")
-            tx_failed_total.inc()
+    def _send_queue(self, from_account: Account, to_addresses: deque):
+        """Send queued transactions from one account sequentially"""
+        successful = 0
+        failed = 0
+
+        while to_addresses:
+            tx_hash = self.send_transaction(from_account, to_addresses.popleft())
+
+            if tx_hash:
+                successful += 1
+            else:
+                failed += 1
+
+        return successful, failed
 
     def send_batch(self):
         """Send a batch of transactions"""
-        logger.info(f"Sending batch of {self.config.txs_per_batch} transactions...")
+        # Attributes used in the loop hoisted to locals
+        accounts = self.accounts
+        txs_per_batch = self.config.txs_per_batch
+        num_accounts = len(accounts)
 
-        successful = 0
-        failed = 0
-        account_last_used = {}  # Track when each account was last used
+        logger.info(f"Sending batch of {txs_per_batch} transactions...")
 
-        for i in range(self.config.txs_per_batch):
-            # Random sender and receiver
-            from_account = random.choice(self.accounts)
-            to_account = random.choice(self.accounts)
+        # Random senders and receivers drawn in bulk
+        senders = random.choices(range(num_accounts), k=txs_per_batch)
+        receivers = random.choices(range(num_accounts), k=txs_per_batch)
 
+        # Group sender/receiver pairs by sender so each account has at most
+        # one in-flight signer
+        queues = {}
+        for sender, receiver in zip(senders, receivers):
             # Don't send to self
-            while to_account.address == from_account.address:
-                to_account = random.choice(self.accounts)
+            if receiver == sender:
+                receiver = (receiver + 1) % num_accounts
 
-            # Add small delay if same account used recently (prevent nonce collisions)
-            if from_account.address in account_last_used:
-                time_since_last = time.time() - account_last_used[from_account.address]
-                if time_since_last < 0.1:  # If used within last 100ms
-                    time.sleep(0.1 - time_since_last)
+            queues.setdefault(accounts[sender], deque()).append(accounts[receiver].address)
 
-            tx_hash = self.send_transaction(from_account, to_account.address)
+        # Fetch gas price, block number and the pending nonce of every sender
+        # in one batch, so local nonces that drifted from the node recover
+        calls = [('eth_gasPrice', []), ('eth_blockNumber', [])]
+        calls.extend(('eth_getTransactionCount', [account.address, 'pending']) for account in queues)
+        try:
+            results = self._batch_rpc_chunked(calls)
+            connection_status.set(1)  # Connected
+        except Exception as e:
+            logger.error(f"Error fetching batch state, skipping batch: {e}")
+            connection_status.set(0)  # Disconnected
+            tx_sent_total.inc(txs_per_batch)  # Count as sent attempts
+            tx_failed_total.inc(txs_per_batch)  # Also count as failed
+            return
 
-            # Track when this account was used
-            account_last_used[from_account.address] = time.time()
+        gas_price = int(results[0], 16)
+        block_number.set(int(results[1], 16))
+        self._build_tx_template(gas_price)
 
-            if tx_hash:
-                successful += 1
-            else:
-                failed += 1
+        # Reseed nonces of this batch's senders, within the batch they are
+        # still incremented locally
+        for account, nonce in zip(queues, results[2:]):
+            with self.nonce_locks[account.address]:
+                self.nonces[account.address] = int(nonce, 16)
+
+        # Drain every sender's queue in parallel
+        futures = [
+            self.executor.submit(self._send_queue, account, to_addresses)
+            for account, to_addresses in queues.items()
+        ]
+
+        successful = 0
+        failed = 0
+        for future in futures:
+            sent_ok, sent_failed = future.result()
+            successful += sent_ok
+            failed += sent_failed
 
-            # Small delay between transactions in batch
-            time.sleep(0.01)
+        # Workers only count locally, flush to the shared counters once per
+        # batch instead of taking the metric locks on every tx
+        tx_sent_total.inc(successful + failed)  # Failed sends count as attempts
+        tx_failed_total.inc(failed)
 
         logger.info(f"Batch complete: {successful} successful, {failed} failed")
 
@@ -301,23 +561,28 @@ class EthereumLoadTester:
     def update_metrics(self):
         """Update general metrics"""
         try:
-            # Check connection first with timeout
-            if not self._check_connection():
-                logger.warning("Cannot update metrics - Web3 not connected")
-                return
+            # Gas price, block number and all balances in one batch, which
+            # also serves as the periodic connection check
+            calls = [('eth_gasPrice', []), ('eth_blockNumber', [])]
+            calls.extend(('eth_getBalance', [account.address, 'latest']) for account in self.accounts)
+            results = self._batch_rpc_chunked(calls)
+            connection_status.set(1)  # Connected
+        except Exception as e:
+            logger.warning(f"Cannot update metrics - connection check failed: {e}")
+            connection_status.set(0)  # Disconnected
+            return
 
+        try:
             # Update gas price
-            gas_price_wei = self.w3.eth.gas_price
-            gas_price_gwei.set(self.w3.from_wei(gas_price_wei, 'gwei'))
+            gas_price_wei = int(results[0], 16)
+            gas_price_gwei.set(gas_price_wei / 1_000_000_000)
 
             # Update block number
-            block_num = self.w3.eth.block_number
-            block_number.set(block_num)
+            block_number.set(int(results[1], 16))
 
             # Update account balances
-            for account in self.accounts:
-                balance = self.w3.eth.get_balance(account.address)
-                current_balance.labels(address=account.address).set(balance)
+            for account, balance in zip(self.accounts, results[2:]):
+                self.balance_gauges[account.address].set(int(balance, 16))
 
         except Exception as e:
             logger.error(f"Error updating metrics: {e}")
@@ -330,6 +595,10 @@ class EthereumLoadTester:
         self.fund_specific_account()
         self.create_accounts()
         self.fund_accounts()
+        self.sync_nonces()
+
+        # Single background thread collecting receipts of all sent txs
+        threading.Thread(target=self._receipt_reaper, daemon=True).start()
 
         logger.info("Starting load test...")
 
@@ -358,6 +627,7 @@ class EthereumLoadTester:
             logger.info("Interrupted by user")
         finally:
             self.running = False
+            self.executor.shutdown(wait=False)
             logger.info("Load test completed")
 
 def load_config_from_env() -> LoadTestConfig: